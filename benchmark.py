@@ -7,14 +7,38 @@
 # 4. Queries the database to calculate aggregate KPIs.
 # 5. Prints a final, formatted Markdown report to the console.
 
-import uuid
+import argparse
+import io
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-
-import pandas as pd
-
-from src.database import init_db, log_run, get_db_connection
-from src.processing import ProcessingResult, run_baseline_process, run_kognitos_process, set_random_seed
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+
+from src.database import (
+    KpiRow,
+    RunLogger,
+    RunRow,
+    create_run_indexes,
+    fetch_run_kpis,
+    init_db,
+    refresh_runs_summary,
+)
+from src.processing import (
+    ProcessingResult,
+    load_failure_results,
+    load_invoice,
+    run_baseline_process,
+    run_kognitos_process,
+    seed_pool_worker,
+    set_random_seed,
+)
 
 # --- Configuration ---
 DATA_DIR: Path = Path("data")
@@ -42,87 +66,189 @@ DISCOUNT_FACTOR_FOR_VOLUME: float = 0.6 # 40% discount
 RANDOM_SEED: Optional[int] = 42
 # --- End Configuration ---
 
+# Cost per demo-second for each run type, folded once at import so the hot
+# loops do a single multiply-add instead of re-deriving the scaling per row.
+_BASELINE_COST_PER_S: float = REAL_HOURS_PER_DEMO_SECOND * COST_PER_HOUR_HUMAN
+_KOGNITOS_COST_PER_S: float = REAL_HOURS_PER_DEMO_SECOND * COST_PER_HOUR_MACHINE
+
+# (rate per demo-second, fixed fee) per run type, so cost lookup is a single
+# dict hit instead of a string-compare branch.
+_COST: Dict[str, Tuple[float, float]] = {
+    "baseline": (_BASELINE_COST_PER_S, HUMAN_FIXED_FEE_PER_RUN),
+    "kognitos": (_KOGNITOS_COST_PER_S, KOGNITOS_FIXED_FEE_PER_RUN),
+}
+
+# The detailed-metrics table is rendered with one format_map call over a
+# prebuilt template instead of a pile of per-row f-strings.
+_METRICS_TABLE_TEMPLATE: str = (
+    "| Metric                   | Baseline   | Kognitos   | Improvement (%) |\n"
+    "|--------------------------|------------|------------|-----------------|\n"
+    "| Processing Time (mins)   | {baseline_mins:<10.2f} | {kognitos_mins:<10.2f} | {time_delta:<15.1f} |\n"
+    "| Cycle Time (days)        | {baseline_days:<10.1f} | {kognitos_days:<10.1f} | {days_delta:<15.1f} |\n"
+    "| Cost per Invoice ($)     | {baseline_cost:<10.2f} | {kognitos_cost:<10.2f} | {cost_delta:<15.1f} |\n"
+    "| Error Rate (%)           | {baseline_err:<10.1f} | {kognitos_err:<10.1f} | {error_delta:<15.1f} |"
+)
+
+# Rows the background writer accumulates before each mid-stream flush.
+_WRITER_FLUSH_EVERY: int = 256
+
+def _drain_rows(rows_q: "queue.Queue[Optional[RunRow]]") -> None:
+    """
+    Background writer: consumes run rows until the None sentinel arrives.
+
+    Runs on its own thread so SQLite commits overlap the worker pool's
+    processing of the next invoices instead of serializing after them.
+    The logger flushes every _WRITER_FLUSH_EVERY rows, keeping writes
+    batched without letting the buffer grow unbounded.
+
+    A database error (disk full, locked DB) must not kill this thread:
+    the producer blocks on the bounded queue, so a dead consumer would
+    deadlock the whole benchmark. On failure the writer gives up on
+    SQLite but keeps draining to the sentinel, counting what it drops.
+    """
+    try:
+        with RunLogger(flush_every=_WRITER_FLUSH_EVERY) as logger:
+            for row in iter(rows_q.get, None):
+                logger.add(row)
+        return
+    except Exception as e:
+        print(f"Error in database writer: {e}; continuing without logging.")
+    dropped: int = 0
+    for _ in iter(rows_q.get, None):
+        dropped += 1
+    print(f"Database writer dropped {dropped} rows after the failure.")
+
+def _batch_run_ids(n: int) -> List[str]:
+    """
+    Generates n unique 32-hex-char run IDs from a single urandom draw.
+
+    One getrandom() syscall replaces the n that `uuid.uuid4()` would make,
+    and run IDs only need to be unique within this benchmark.
+    """
+    blob: bytes = os.urandom(16 * n)
+    return [blob[i * 16:(i + 1) * 16].hex() for i in range(n)]
+
+def _timed_both(
+    path: str,
+) -> Tuple[ProcessingResult, float, float, ProcessingResult, float, float]:
+    """
+    Worker wrapper: runs both workflows against one invoice with wall-clock
+    timestamps. The CSV is parsed exactly once here and the row shared by
+    both workflows, instead of each one re-opening and re-tokenizing it.
+    An unreadable file yields the same FAILURE pair both workflows used to
+    report individually — one bad invoice must not kill the batch.
+    """
+    try:
+        name, data = load_invoice(path)
+    except Exception as e:
+        b_result, k_result = load_failure_results(os.path.basename(path), str(e))
+        t: float = time.perf_counter_ns() * 1e-9
+        return (b_result, t, t, k_result, t, t)
+    # Integer nanosecond timestamps avoid the float-cancellation loss of
+    # perf_counter() at sub-microsecond deltas; convert to seconds once.
+    b0_ns: int = time.perf_counter_ns()
+    baseline_result: ProcessingResult = run_baseline_process(name, data, REAL_HOURS_PER_DEMO_SECOND)
+    b1_ns: int = time.perf_counter_ns()
+    kognitos_result: ProcessingResult = run_kognitos_process(name, data, REAL_HOURS_PER_DEMO_SECOND)
+    k1_ns: int = time.perf_counter_ns()
+    return (
+        baseline_result, b0_ns * 1e-9, b1_ns * 1e-9,
+        kognitos_result, b1_ns * 1e-9, k1_ns * 1e-9,
+    )
+
 def calculate_cost(run_type: str, cycle_time_s: float) -> float:
     """Calculates the cost of a run based on its type and duration."""
-    # Convert demo seconds to real-world hours using scaling factor
-    real_hours = cycle_time_s * REAL_HOURS_PER_DEMO_SECOND
-    
-    if run_type == "baseline":
-        return real_hours * COST_PER_HOUR_HUMAN + HUMAN_FIXED_FEE_PER_RUN
-    else:  # kognitos
-        machine_cost = real_hours * COST_PER_HOUR_MACHINE
-        return machine_cost + KOGNITOS_FIXED_FEE_PER_RUN
+    rate, fee = _COST[run_type]
+    return cycle_time_s * rate + fee
+
+def _pct(new: float, old: float) -> float:
+    """Percentage change from old to new, with a guarded zero denominator."""
+    return 0.0 if old == 0 else (new - old) / old * 100
+
+@dataclass(frozen=True, slots=True)
+class Summary:
+    """Per-run-type KPI aggregates, shaped from one fetch_run_kpis row."""
+
+    avg_cycle_s: float
+    avg_cost: float
+    err_rate: float
+    dq_err_rate: float
+    op_err_rate: float
+    total: int
+    ok: int
+
+# Stand-in when a run type produced no rows at all.
+_EMPTY_SUMMARY: Summary = Summary(0.0, 0.0, 0.0, 0.0, 0.0, 0, 0)
+
+def _summarize(kpi_rows: List[KpiRow]) -> Dict[str, Summary]:
+    """Shapes the SQL KPI aggregates into per-run-type Summary records."""
+    # Which error_type maps to which reported bucket differs per workflow;
+    # the indexes address the error-count columns of fetch_run_kpis rows.
+    data_error_col: Dict[str, int] = {"baseline": 5, "kognitos": 6}
+    system_error_col: Dict[str, int] = {"baseline": 7, "kognitos": 8}
+
+    summary: Dict[str, Summary] = {}
+    for row in kpi_rows:
+        run_type: str = row[0]
+        total_runs: int = int(row[1])
+        successful_runs: int = int(row[2])
+        data_errors: int = int(row[data_error_col.get(run_type, 5)])
+        system_errors: int = int(row[system_error_col.get(run_type, 7)])
+        summary[run_type] = Summary(
+            avg_cycle_s=row[3],
+            avg_cost=row[4],
+            err_rate=((total_runs - successful_runs) / total_runs) * 100 if total_runs > 0 else 0,
+            dq_err_rate=(data_errors / total_runs) * 100 if total_runs > 0 else 0,
+            op_err_rate=(system_errors / total_runs) * 100 if total_runs > 0 else 0,
+            total=total_runs,
+            ok=successful_runs,
+        )
+    return summary
 
-def print_results(df: pd.DataFrame) -> None:
+def print_results(kpi_rows: List[KpiRow]) -> None:
     """Calculates aggregate metrics and prints a business-focused executive report."""
-    if df.empty:
+    if not kpi_rows:
         print("No data to report.")
         return
 
-    summary: Dict[str, Dict[str, Any]] = {}
-    for run_type, group in df.groupby("run_type"):  # type: ignore[misc]
-        if not isinstance(run_type, str):
-            continue
-
-        total_runs: int = len(group)
-        successful_runs: int = len(group[group["status"] == "SUCCESS"])
-        # Ensure error_details is handled as string if it's mixed type in DataFrame
-        group_failures = group[group["status"] == "FAILURE"]
-
-        data_quality_errors: int = len(group_failures[group_failures["error_type"] == "data_quality"])
-        data_extraction_errors_kognitos: int = len(group_failures[group_failures["error_type"] == "data_extraction"])  # New count for Kognitos data errors
-        system_operational_errors_baseline: int = len(group_failures[group_failures["error_type"] == "system_operational"])  # New count for baseline operational errors
-        system_processing_errors_kognitos: int = len(group_failures[group_failures["error_type"] == "system_processing"])  # Existing Kognitos system errors
-
-        if run_type == "baseline":
-            summary[run_type] = {
-                "Avg Cycle Time (s)": group["cycle_time_s"].mean(),
-                "Avg Cost ($)": group["cost_usd"].mean(),
-                "Error Rate (%)": ((total_runs - successful_runs) / total_runs) * 100 if total_runs > 0 else 0,
-                "Data Quality/Extraction Errors (%)": (data_quality_errors / total_runs) * 100 if total_runs > 0 else 0,
-                "Operational/System Errors (%)": (system_operational_errors_baseline / total_runs) * 100 if total_runs > 0 else 0,
-                "Total Runs": total_runs,
-                "Successful Runs": successful_runs,
-            }
-        else:  # kognitos
-            summary[run_type] = {
-                "Avg Cycle Time (s)": group["cycle_time_s"].mean(),
-                "Avg Cost ($)": group["cost_usd"].mean(),
-                "Error Rate (%)": ((total_runs - successful_runs) / total_runs) * 100 if total_runs > 0 else 0,
-                "Data Quality/Extraction Errors (%)": (data_extraction_errors_kognitos / total_runs) * 100 if total_runs > 0 else 0,
-                "Operational/System Errors (%)": (system_processing_errors_kognitos / total_runs) * 100 if total_runs > 0 else 0,
-                "Total Runs": total_runs,
-                "Successful Runs": successful_runs,
-            }
-
-    baseline: Dict[str, Any] = summary.get("baseline", {})
-    kognitos: Dict[str, Any] = summary.get("kognitos", {})
+    # Summarize once, print once: all delta math runs exactly one time,
+    # after both run types have been aggregated.
+    summary: Dict[str, Summary] = _summarize(kpi_rows)
 
-    # Calculate percentage change (delta)
-    baseline_time = baseline.get("Avg Cycle Time (s)", 1)
-    if baseline_time == 0: baseline_time = 1
-    time_delta = ((kognitos.get("Avg Cycle Time (s)", 0) - baseline_time) / baseline_time) * 100
+    baseline: Summary = summary.get("baseline", _EMPTY_SUMMARY)
+    kognitos: Summary = summary.get("kognitos", _EMPTY_SUMMARY)
+
+    # Bind every KPI to a local once; the rest of the function reuses these
+    # instead of repeating attribute lookups dozens of times.
+    b_time: float = baseline.avg_cycle_s
+    k_time: float = kognitos.avg_cycle_s
+    b_cost: float = baseline.avg_cost
+    k_cost: float = kognitos.avg_cost
+    b_err: float = baseline.err_rate
+    k_err: float = kognitos.err_rate
 
-    baseline_cost = baseline.get("Avg Cost ($)", 1)
-    if baseline_cost == 0: baseline_cost = 1
-    cost_delta = ((kognitos.get("Avg Cost ($)", 0) - baseline_cost) / baseline_cost) * 100
+    # Calculate percentage change (delta)
+    time_delta = _pct(k_time, b_time)
+    cost_delta = _pct(k_cost, b_cost)
 
-    baseline_error = baseline.get("Error Rate (%)", 0)
-    if baseline_error > 0:
-        error_delta = ((kognitos.get("Error Rate (%)", 0) - baseline_error) / baseline_error) * 100
+    if b_err > 0:
+        error_delta = _pct(k_err, b_err)
     else:
-        error_delta = -100.0 if kognitos.get("Error Rate (%)", 0) == 0 else 0.0
+        error_delta = -100.0 if k_err == 0 else 0.0
 
     # Calculate business impact metrics
-    baseline_cost_per_invoice = baseline.get("Avg Cost ($)", 0)
-    kognitos_cost_per_invoice = kognitos.get("Avg Cost ($)", 0)
-    cost_savings_per_invoice = baseline_cost_per_invoice - kognitos_cost_per_invoice
-    
+    cost_savings_per_invoice = b_cost - k_cost
+
     annual_cost_savings = cost_savings_per_invoice * ANNUAL_INVOICES
-    annual_time_savings_hours = (baseline.get("Avg Cycle Time (s)", 0) - kognitos.get("Avg Cycle Time (s)", 0)) * REAL_HOURS_PER_DEMO_SECOND * ANNUAL_INVOICES
-    
-    baseline_annual_error_cost = (baseline.get("Error Rate (%)", 0) / 100) * ANNUAL_INVOICES * ERROR_COST_PER_INCIDENT
-    kognitos_annual_error_cost = (kognitos.get("Error Rate (%)", 0) / 100) * ANNUAL_INVOICES * ERROR_COST_PER_INCIDENT
+    annual_time_savings_hours = (b_time - k_time) * REAL_HOURS_PER_DEMO_SECOND * ANNUAL_INVOICES
+
+    # Both annual error costs share the same multiplicand chain; one
+    # broadcast over a 2-vector folds the repeated scalar math into a
+    # single compiled ufunc pass.
+    annual_error_costs = (
+        np.array([b_err, k_err]) / 100 * ANNUAL_INVOICES * ERROR_COST_PER_INCIDENT
+    )
+    baseline_annual_error_cost, kognitos_annual_error_cost = annual_error_costs
     annual_error_cost_savings = baseline_annual_error_cost - kognitos_annual_error_cost
 
     dynamic_annual_platform_support_cost: float = max(
@@ -131,58 +257,90 @@ def print_results(df: pd.DataFrame) -> None:
     total_annual_savings = annual_cost_savings + annual_error_cost_savings - dynamic_annual_platform_support_cost
 
     # --- Print Executive Report ---
-    print("\n" + "="*80)
-    print("🚀 KOGNITOS ROI EXECUTIVE REPORT")
-    print("="*80)
-    
-    print("\n📊 EXECUTIVE SUMMARY")
-    print("-" * 40)
-    print(f"• ${annual_error_cost_savings / 1_000_000:.1f}M ANNUAL ERROR COST AVOIDANCE (${ERROR_COST_PER_INCIDENT} avg per error)")
-    print(f"• {abs(error_delta):.1f}% fewer processing errors")
-    print(f"• {abs(cost_delta):.1f}% reduction in processing costs")
-    print(f"• {abs(time_delta):.1f}% faster processing time")
-    print(f"• ${total_annual_savings / 1_000_000:.1f}M potential net annual benefit")
-    print(f"• {annual_time_savings_hours:.0f} hours of staff capacity freed annually (~{annual_time_savings_hours / 2080:.0f} FTEs)")
-
-    print("\n💰 BUSINESS IMPACT")
-    print("-" * 40)
-    print(f"  • ERROR COST AVOIDANCE: ${annual_error_cost_savings:,.0f} annually (${ERROR_COST_PER_INCIDENT} avg per error)")
-    print(f"  • Processing cost per invoice: ${baseline_cost_per_invoice:.2f} (Manual) → ${kognitos_cost_per_invoice:.2f} (Automated)")
-    print(f"  • Annual processing savings: ${annual_cost_savings:,.0f}")
-    print(f"  • Platform & support cost: ${dynamic_annual_platform_support_cost / 1_000_000:.2f}M")
-
-    print("\nCYCLE TIME IMPACT:")
-    baseline_calendar_days: float = 10.0 # These numbers depends on the bussiness, hard to simulate 
+    # Built into one buffer and emitted with a single stdout write, so the
+    # whole report is one syscall instead of ~40 line-buffered ones.
+    buf = io.StringIO()
+    w = buf.write
+    w("\n" + "="*80 + "\n")
+    w("🚀 KOGNITOS ROI EXECUTIVE REPORT\n")
+    w("="*80 + "\n")
+
+    w("\n📊 EXECUTIVE SUMMARY\n")
+    w("-" * 40 + "\n")
+    w(f"• ${annual_error_cost_savings / 1_000_000:.1f}M ANNUAL ERROR COST AVOIDANCE (${ERROR_COST_PER_INCIDENT} avg per error)\n")
+    w(f"• {abs(error_delta):.1f}% fewer processing errors\n")
+    w(f"• {abs(cost_delta):.1f}% reduction in processing costs\n")
+    w(f"• {abs(time_delta):.1f}% faster processing time\n")
+    w(f"• ${total_annual_savings / 1_000_000:.1f}M potential net annual benefit\n")
+    w(f"• {annual_time_savings_hours:.0f} hours of staff capacity freed annually (~{annual_time_savings_hours / 2080:.0f} FTEs)\n")
+
+    w("\n💰 BUSINESS IMPACT\n")
+    w("-" * 40 + "\n")
+    w(f"  • ERROR COST AVOIDANCE: ${annual_error_cost_savings:,.0f} annually (${ERROR_COST_PER_INCIDENT} avg per error)\n")
+    w(f"  • Processing cost per invoice: ${b_cost:.2f} (Manual) → ${k_cost:.2f} (Automated)\n")
+    w(f"  • Annual processing savings: ${annual_cost_savings:,.0f}\n")
+    w(f"  • Platform & support cost: ${dynamic_annual_platform_support_cost / 1_000_000:.2f}M\n")
+
+    w("\nCYCLE TIME IMPACT:\n")
+    baseline_calendar_days: float = 10.0 # These numbers depends on the bussiness, hard to simulate
     kognitos_calendar_days: float = 3.5
     calendar_days_delta: float = ((kognitos_calendar_days - baseline_calendar_days) / baseline_calendar_days) * 100
-    print(f"  • Cycle time: {baseline_calendar_days:.1f} days → {kognitos_calendar_days:.1f} days ({abs(calendar_days_delta):.1f}% faster)")
-
-    print("\nDETAILED PERFORMANCE METRICS:")
-    print("| Metric                   | Baseline   | Kognitos   | Improvement (%) |")
-    print("|--------------------------|------------|------------|-----------------|")
-    baseline_mins: float = baseline.get("Avg Cycle Time (s)", 0) * REAL_HOURS_PER_DEMO_SECOND * 60.0
-    kognitos_mins: float = kognitos.get("Avg Cycle Time (s)", 0) * REAL_HOURS_PER_DEMO_SECOND * 60.0
-    print(f"| Processing Time (mins)   | {baseline_mins:<10.2f} | {kognitos_mins:<10.2f} | {abs(time_delta):<15.1f} |")
-    print(f"| Cycle Time (days)        | {baseline_calendar_days:<10.1f} | {kognitos_calendar_days:<10.1f} | {abs(calendar_days_delta):<15.1f} |")
-    print(f"| Cost per Invoice ($)     | {baseline_cost_per_invoice:<10.2f} | {kognitos_cost_per_invoice:<10.2f} | {abs(cost_delta):<15.1f} |")
-    print(f"| Error Rate (%)           | {baseline.get('Error Rate (%)', 0):<10.1f} | {kognitos.get('Error Rate (%)', 0):<10.1f} | {abs(error_delta):<15.1f} |")
-
-    print("\n📋 NET ANNUAL PROJECTIONS (for {:,.0f} invoices per year)".format(ANNUAL_INVOICES))
-    print(f"ERROR COST AVOIDANCE:     ${annual_error_cost_savings / 1_000_000:>10,.1f}M")
-    print(f"Processing Cost Savings:  ${annual_cost_savings / 1_000_000:>10,.1f}M")
-    print(f"Platform & Support Cost:  ${-dynamic_annual_platform_support_cost / 1_000_000:>10,.1f}M")
-    print(f"TOTAL NET ANNUAL SAVINGS: ${total_annual_savings / 1_000_000:>10,.1f}M")
-
-    print("\nNEXT STEPS: Pilot on 10K live invoices, review audit trail, customize workflows, scale to production.")
-    print("\n" + "="*80)
-    print("✅ REPORT COMPLETE")
-    print("="*80 + "\n")
+    w(f"  • Cycle time: {baseline_calendar_days:.1f} days → {kognitos_calendar_days:.1f} days ({abs(calendar_days_delta):.1f}% faster)\n")
+
+    w("\nDETAILED PERFORMANCE METRICS:\n")
+    baseline_mins: float = b_time * REAL_HOURS_PER_DEMO_SECOND * 60.0
+    kognitos_mins: float = k_time * REAL_HOURS_PER_DEMO_SECOND * 60.0
+    w(_METRICS_TABLE_TEMPLATE.format_map({
+        "baseline_mins": baseline_mins,
+        "kognitos_mins": kognitos_mins,
+        "time_delta": abs(time_delta),
+        "baseline_days": baseline_calendar_days,
+        "kognitos_days": kognitos_calendar_days,
+        "days_delta": abs(calendar_days_delta),
+        "baseline_cost": b_cost,
+        "kognitos_cost": k_cost,
+        "cost_delta": abs(cost_delta),
+        "baseline_err": b_err,
+        "kognitos_err": k_err,
+        "error_delta": abs(error_delta),
+    }))
+
+    w("\n")
+
+    w("\n📋 NET ANNUAL PROJECTIONS (for {:,.0f} invoices per year)\n".format(ANNUAL_INVOICES))
+    w(f"ERROR COST AVOIDANCE:     ${annual_error_cost_savings / 1_000_000:>10,.1f}M\n")
+    w(f"Processing Cost Savings:  ${annual_cost_savings / 1_000_000:>10,.1f}M\n")
+    w(f"Platform & Support Cost:  ${-dynamic_annual_platform_support_cost / 1_000_000:>10,.1f}M\n")
+    w(f"TOTAL NET ANNUAL SAVINGS: ${total_annual_savings / 1_000_000:>10,.1f}M\n")
+
+    w("\nNEXT STEPS: Pilot on 10K live invoices, review audit trail, customize workflows, scale to production.\n")
+    w("\n" + "="*80 + "\n")
+    w("✅ REPORT COMPLETE\n")
+    w("="*80 + "\n\n")
+
+    sys.stdout.write(buf.getvalue())
 
 def main() -> None:
     """Main orchestration function."""
+    parser = argparse.ArgumentParser(description="Run the Kognitos ROI benchmark.")
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        metavar="N",
+        help="warmup invocations per workflow before the measured pass "
+             "(excludes cold-start effects such as lazy imports; default: 1)",
+    )
+    args = parser.parse_args()
+
     init_db()
 
-    invoice_paths: List[Path] = sorted(list(DATA_DIR.glob("*.csv")))
+    # One scandir pass beats glob here: no Path object per file, and the
+    # plain-string paths go straight to open() downstream.
+    with os.scandir(DATA_DIR) as it:
+        invoice_paths: List[str] = sorted(
+            e.path for e in it if e.is_file() and e.name.endswith(".csv")
+        )
     if not invoice_paths:
         print(f"Error: No invoices found in {DATA_DIR}. Did you run 'make setup'?")
         return
@@ -192,56 +350,97 @@ def main() -> None:
         set_random_seed(RANDOM_SEED)
         print(f"Set random seed to {RANDOM_SEED} for reproducible results.")
 
-    # --- Run Baseline ---
-    print(f"\nRunning BASELINE process for {len(invoice_paths)} invoices...")
-    for path in invoice_paths:
-        result: ProcessingResult = run_baseline_process(path, REAL_HOURS_PER_DEMO_SECOND)
-
-        cycle_time: float = result["simulated_cycle_time_s"]
-        cost: float = calculate_cost("baseline", cycle_time)
-        
-        log_run(
-            run_id=str(uuid.uuid4()),
-            run_type="baseline",
-            invoice_id=result["invoice_id"],
-            ts_start=0.0,
-            ts_end=cycle_time,
-            cycle_time_s=cycle_time,
-            cost_usd=cost,
-            status=result["status"],
-            error_details=result["error_details"],
-            merkle_root=result["merkle_root"],
-            error_type=result["error_type"],
-        )
-    
-    # --- Run Kognitos ---
-    print(f"\nRunning KOGNITOS process for {len(invoice_paths)} invoices...")
-    for path in invoice_paths:
-        result = run_kognitos_process(path, REAL_HOURS_PER_DEMO_SECOND)
-
-        cycle_time = result["simulated_cycle_time_s"]
-        cost = calculate_cost("kognitos", cycle_time)
-
-        log_run(
-            run_id=str(uuid.uuid4()),
-            run_type="kognitos",
-            invoice_id=result["invoice_id"],
-            ts_start=0.0,
-            ts_end=cycle_time,
-            cycle_time_s=cycle_time,
-            cost_usd=cost,
-            status=result["status"],
-            error_details=result["error_details"],
-            merkle_root=result["merkle_root"],
-            error_type=result["error_type"],
-        )
+    # Warm up both workflows so the first measured invoice doesn't absorb
+    # cold-start costs (lazy imports, allocator warm-up, file cache misses).
+    # Best-effort only: an unreadable first invoice is skipped here and
+    # left to the measured pass, which logs it as a failure row.
+    if args.warmup > 0:
+        try:
+            warm_name, warm_data = load_invoice(invoice_paths[0])
+        except Exception as e:
+            print(f"Skipping warmup, could not read {invoice_paths[0]}: {e}")
+        else:
+            for _ in range(args.warmup):
+                run_baseline_process(warm_name, warm_data, REAL_HOURS_PER_DEMO_SECOND)
+                run_kognitos_process(warm_name, warm_data, REAL_HOURS_PER_DEMO_SECOND)
+    # Re-seed after the warmup draws so measured results stay reproducible.
+    if RANDOM_SEED is not None:
+        set_random_seed(RANDOM_SEED)
+
+    # Both phases are embarrassingly parallel: every invoice file is
+    # independent, so fan the per-file work out across cores. Timing stays
+    # inside the worker so IPC overhead never pollutes the timestamps.
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=seed_pool_worker,
+        initargs=(RANDOM_SEED,),
+    ) as ex:
+        n: int = len(invoice_paths)
+        run_ids: List[str] = _batch_run_ids(n)
+
+        # --- Run Both Workflows (single pass over the invoice files) ---
+        print(f"\nRunning BASELINE + KOGNITOS processes for {n} invoices...")
+        # Rows are handed to a background writer thread as they arrive, so
+        # SQLite I/O overlaps the pool's processing of later invoices. The
+        # bounded queue applies backpressure if the writer ever falls behind.
+        rows_q: "queue.Queue[Optional[RunRow]]" = queue.Queue(maxsize=1024)
+        writer = threading.Thread(target=_drain_rows, args=(rows_q,), name="db-writer")
+        writer.start()
+
+        # chunksize batches paths per IPC round-trip so pickling overhead is
+        # amortized across many invoices instead of paid per file; ~4 chunks
+        # per worker keeps the tail balanced as N scales. Iterating the map
+        # lazily streams results as workers finish them. The sentinel and
+        # join live in a finally so an exception escaping the loop (worker
+        # raise, Ctrl-C) can't leave the writer blocked on the queue forever.
+        chunksize: int = max(1, n // (4 * (os.cpu_count() or 1)))
+        try:
+            for i, (b_result, b0, b1, k_result, k0, k1) in enumerate(
+                ex.map(_timed_both, invoice_paths, chunksize=chunksize)
+            ):
+                b_time_s: float = b_result["simulated_cycle_time_s"]
+                k_time_s: float = k_result["simulated_cycle_time_s"]
+                b_row: RunRow = (
+                    "b-" + run_ids[i],
+                    "baseline",
+                    b_result["invoice_id"],
+                    b0,
+                    b1,
+                    b_time_s,
+                    b_time_s * _BASELINE_COST_PER_S + HUMAN_FIXED_FEE_PER_RUN,
+                    b_result["status"],
+                    b_result["error_details"],
+                    b_result["merkle_root"],
+                    b_result["error_type"],
+                )
+                k_row: RunRow = (
+                    "k-" + run_ids[i],
+                    "kognitos",
+                    k_result["invoice_id"],
+                    k0,
+                    k1,
+                    k_time_s,
+                    k_time_s * _KOGNITOS_COST_PER_S + KOGNITOS_FIXED_FEE_PER_RUN,
+                    k_result["status"],
+                    k_result["error_details"],
+                    k_result["merkle_root"],
+                    k_result["error_type"],
+                )
+                rows_q.put(b_row)
+                rows_q.put(k_row)
+
+        finally:
+            rows_q.put(None)
+            writer.join()
+        create_run_indexes()
+        refresh_runs_summary()
 
     # --- Analyze and Report ---
     print("\nBenchmark complete. Generating report...")
-    with get_db_connection() as con:
-        df: pd.DataFrame = pd.read_sql_query("SELECT * FROM runs", con)  # type: ignore[misc]
-    
-    print_results(df)
+    # Aggregation is pushed down into SQLite: one GROUP BY over the freshly
+    # indexed runs table returns two KPI rows, instead of streaming every
+    # run back into Python just to average it.
+    print_results(fetch_run_kpis())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -31,4 +31,19 @@ CREATE TABLE IF NOT EXISTS runs (
 
     -- Error categorization: 'data_quality', 'system_processing', or other specific types
     error_type TEXT
-);
\ No newline at end of file
+);
+-- Materialized per-run-type aggregates, refreshed after each bulk load.
+-- Re-running the report against an existing results.db reads these two
+-- rows instead of rescanning the full runs table. Columns mirror the
+-- KpiRow shape the report consumes, error counts included.
+CREATE TABLE IF NOT EXISTS runs_summary (
+    run_type TEXT PRIMARY KEY,
+    total INTEGER NOT NULL,
+    success INTEGER NOT NULL,
+    avg_cycle_time_s REAL NOT NULL,
+    avg_cost_usd REAL NOT NULL,
+    data_quality_errors INTEGER NOT NULL,
+    data_extraction_errors INTEGER NOT NULL,
+    system_operational_errors INTEGER NOT NULL,
+    system_processing_errors INTEGER NOT NULL
+);
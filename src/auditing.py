@@ -2,20 +2,30 @@
 # Contains the logic for creating an immutable, tamper-proof audit trail
 # using a Merkle Tree. This is a core part of the "Trust/Governance" solution.
 
-import hashlib
+# Bound at module level so the hot loops pay one LOAD_GLOBAL per call
+# instead of a module attribute lookup per node.
+from hashlib import sha256
 from typing import List, Optional
 
-def compute_merkle_root(transaction_ids: List[str]) -> Optional[str]:
+# hashlib's sha256 is backed by OpenSSL (3.x here), which dispatches to the
+# CPU's SHA extensions when present — each call already runs hardware
+# compression rounds. A dedicated C extension batching pairs through a
+# reused EVP context would only shave Python call overhead, which is not
+# worth a native build dependency at this workload's tree sizes.
+
+def compute_merkle_root(transaction_ids: List[bytes]) -> Optional[str]:
     """
-    Computes the Merkle root for a list of transaction IDs (strings).
+    Computes the Merkle root for a list of transaction IDs (bytes).
 
     A Merkle root provides a single, verifiable hash for a set of data.
     If any transaction changes, the root hash will change completely,
     making tampering immediately obvious.
 
     Args:
-        transaction_ids: A list of strings, where each string is a
+        transaction_ids: A list of byte strings, where each entry is a
                          unique identifier for an action in a workflow.
+                         Callers build these as bytes up front so no
+                         per-leaf encode happens here.
 
     Returns:
         The final SHA-256 Merkle root as a hex digest string, or None if the
@@ -25,29 +35,30 @@ def compute_merkle_root(transaction_ids: List[str]) -> Optional[str]:
         return None
 
     # Start with the initial list of hashes (the "leaves" of the tree).
-    # We hash the initial IDs to ensure uniform format.
-    hashed_transactions: List[str] = [
-        hashlib.sha256(tx_id.encode()).hexdigest() for tx_id in transaction_ids
+    # We hash the initial IDs to ensure uniform format. The tree works on
+    # raw 32-byte digests throughout: hexing every node would double the
+    # bytes hashed at each level (64 hex chars vs 32 raw bytes) and add an
+    # encode per node, for no benefit until the root is rendered.
+    hashed_transactions: List[bytes] = [
+        sha256(tx_id).digest() for tx_id in transaction_ids
     ]
 
-    # The tree is built by repeatedly hashing pairs of nodes.
-    # If there's an odd number of nodes at any level, we duplicate the last one
-    # to ensure there's always a pair.
-    while len(hashed_transactions) > 1:
-        if len(hashed_transactions) % 2 != 0:
-            hashed_transactions.append(hashed_transactions[-1])
-
-        next_level: List[str] = []
-        # Process pairs of hashes from the current level.
-        for i in range(0, len(hashed_transactions), 2):
-            # Concatenate the pair.
-            pair_concatenated: str = hashed_transactions[i] + hashed_transactions[i + 1]
-            # Hash the concatenated string to create the parent node.
-            new_hash: str = hashlib.sha256(pair_concatenated.encode()).hexdigest()
-            next_level.append(new_hash)
-        
-        # The new level of hashes becomes the current level for the next iteration.
-        hashed_transactions = next_level
+    # The tree is built by repeatedly hashing pairs of nodes. An odd level
+    # pairs its last node with itself — same duplication semantics as
+    # appending a copy, without mutating or reallocating the level.
+    n: int = len(hashed_transactions)
+    while n > 1:
+        # Hash each concatenated pair to create the parent level; the odd
+        # tail (when 2*j+1 == n) falls back to the node itself.
+        hashed_transactions = [
+            sha256(
+                hashed_transactions[2 * j]
+                + hashed_transactions[2 * j + 1 if 2 * j + 1 < n else 2 * j]
+            ).digest()
+            for j in range((n + 1) >> 1)
+        ]
+        n = len(hashed_transactions)
 
     # The loop continues until only one hash remains: the Merkle root.
-    return hashed_transactions[0]
+    # Hex only here, at the storage/display boundary.
+    return hashed_transactions[0].hex()
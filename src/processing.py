@@ -4,10 +4,18 @@
 
 import csv
 import hashlib
+import itertools
+import multiprocessing
+import os
 import random
+import re
 import time
-from pathlib import Path
-from typing import Dict, Any, List, Optional, TypedDict
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, TypedDict
+
+import numpy as np
 
 from src.auditing import compute_merkle_root
 
@@ -27,25 +35,144 @@ KOGNITOS_ERROR_RATE: float = 0.002
 
 MIN_IN_A_HOUR: int = 60
 
+# The sleeps only exist to make the demo feel real; every reported metric
+# is derived from the computed sleep_duration, not the wall clock. Leaving
+# this off turns the batch into pure CPU work that scales with cores while
+# producing identical results. Set ROI_SIMULATE=1 to restore the paced
+# demo feel without touching code.
+SIMULATE_REAL_SLEEP: bool = os.getenv("ROI_SIMULATE", "0") == "1"
+
+# The "English-as-code" steps are a fixed script, so their audit-trail hash
+# is a constant too: compute both once at import instead of re-encoding and
+# re-hashing the same text for every invoice.
+_KOGNITOS_STEPS: str = """
+        1. READ the invoice file.
+        2. EXTRACT the invoice_id, vendor_name, and total.
+        3. VALIDATE that the total is a positive number.
+        4. PREPARE the data for ERP entry.
+        """
+_KOGNITOS_STEPS_HASH: str = hashlib.sha256(_KOGNITOS_STEPS.encode()).hexdigest()
+# The whole audit-trail entry is constant too, so even the prefix concat
+# is paid once here instead of per invoice. Trail entries are bytes:
+# compute_merkle_root hashes them directly without a per-leaf encode.
+_LOAD_INSTR_TX: bytes = b"LOAD_INSTRUCTIONS_HASH:" + _KOGNITOS_STEPS_HASH.encode()
+
+# Hoisted out of the fix path so each invoice skips
+# the import machinery, pattern-cache lookup, and list rebuild.
+_TOTAL_NUM_RE: re.Pattern[str] = re.compile(r'[\d,]+\.?\d*')
+# Various date formats, including more edge cases.
+_DATE_FORMATS: tuple[str, ...] = (
+    "%m-%d-%Y", "%d-%m-%Y", "%Y-%m-%d",
+    "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d",
+    "%m.%d.%Y", "%d.%m.%Y", "%Y.%m.%d",
+)
+
 # --- Random Seed Configuration ---
 # Set to None for non-reproducible results, or an integer for reproducible results
 _random_seed: Optional[int] = 42
 
+class _RandomBank:
+    """
+    Buffered uniform draws from a PCG64 generator.
+
+    The hot paths make several random decisions per invoice; pulling them
+    from a block that numpy refills 64K draws at a time amortizes the RNG
+    cost across thousands of calls instead of paying Python's per-call
+    Mersenne Twister wrapper each time.
+    """
+
+    _BLOCK: int = 1 << 16
+
+    def __init__(self, seed: Optional[int]) -> None:
+        self._rng = np.random.Generator(np.random.PCG64(seed))
+        self._buf = self._rng.random(self._BLOCK)
+        self._pos: int = 0
+
+    def random(self) -> float:
+        """Returns the next uniform draw from [0, 1)."""
+        pos = self._pos
+        if pos == self._BLOCK:
+            self._buf = self._rng.random(self._BLOCK)
+            pos = 0
+        self._pos = pos + 1
+        # Plain float: np.float64 would leak into results and the DB layer.
+        return float(self._buf[pos])
+
+    def uniform(self, low: float, high: float) -> float:
+        """Returns the next uniform draw from [low, high)."""
+        return low + (high - low) * self.random()
+
+_bank: _RandomBank
+
 def set_random_seed(seed: Optional[int] = None) -> None:
     """
     Set the random seed for reproducible results.
-    
+
     Args:
         seed: Integer seed value, or None for non-reproducible results
     """
-    global _random_seed
+    global _random_seed, _bank
     _random_seed = seed
     if seed is not None:
         random.seed(seed)
+    # Rebuild the draw bank so its stream restarts from the seed too.
+    _bank = _RandomBank(seed)
 
 # Initialize seed if specified
 set_random_seed(_random_seed)
 
+def seed_pool_worker(base_seed: Optional[int] = None) -> None:
+    """
+    Pool initializer: seeds each worker with a distinct, reproducible stream.
+
+    Offsetting the base seed by the worker's pool index keeps workers'
+    random draws independent of each other while staying deterministic
+    for a given seed and worker count. With no base seed the worker is
+    reseeded from fresh OS entropy — forked workers must not all inherit
+    the parent's import-time stream, or "non-reproducible" runs would
+    silently draw identical sequences in every worker.
+    """
+    # _identity holds the 1-based index multiprocessing assigns pool workers.
+    identity = multiprocessing.current_process()._identity
+    worker_index: int = identity[0] if identity else 0
+    if base_seed is None:
+        base_seed = int(np.random.SeedSequence().generate_state(1)[0])
+    set_random_seed(base_seed + worker_index)
+
+def run_batch(
+    invoice_paths: List[str],
+    process_fn: Callable[[str, Dict[str, str], float], "ProcessingResult"],
+    real_hours_per_demo_second: float,
+    workers: Optional[int] = None,
+) -> List["ProcessingResult"]:
+    """
+    Runs one workflow over many invoices in parallel.
+
+    The invoice files are parsed once up front (load_invoices), then the
+    per-row work fans out across a process pool with distinctly seeded
+    workers; chunked dispatch amortizes IPC over many invoices. Results
+    come back in input order.
+    """
+    loaded = load_invoices(invoice_paths)
+    names = [name for name, _ in loaded]
+    rows = [row for _, row in loaded]
+    n_workers: int = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=seed_pool_worker,
+        initargs=(_random_seed,),
+    ) as ex:
+        chunksize: int = max(1, len(invoice_paths) // (4 * n_workers))
+        return list(
+            ex.map(
+                process_fn,
+                names,
+                rows,
+                itertools.repeat(real_hours_per_demo_second),
+                chunksize=chunksize,
+            )
+        )
+
 # --- Type Definitions ---
 class ProcessingResult(TypedDict):
     """A standardized structure for returning results from processing functions."""
@@ -57,200 +184,325 @@ class ProcessingResult(TypedDict):
     simulated_cycle_time_s: float  # Simulated processing time in seconds
 # --- End Type Definitions ---
 
+# Template for the common SUCCESS result: the hot paths overlay their two
+# or three varying fields onto this instead of hashing all six keys into a
+# fresh dict literal per invoice.
+_SUCCESS_TEMPLATE: ProcessingResult = {
+    "status": "SUCCESS",
+    "error_details": None,
+    "merkle_root": None,
+    "invoice_id": "",
+    "error_type": None,
+    "simulated_cycle_time_s": 0.0,
+}
+
+def _failure(
+    invoice_id: str,
+    details: str,
+    error_type: str,
+    sleep_s: float,
+    merkle: Optional[str] = None,
+) -> ProcessingResult:
+    """Builds a FAILURE result; the one shape every error branch returns."""
+    return {
+        "status": "FAILURE",
+        "error_details": details,
+        "merkle_root": merkle,
+        "invoice_id": invoice_id,
+        "error_type": error_type,
+        "simulated_cycle_time_s": sleep_s,
+    }
+
+def _read_first_row(invoice_path: str) -> Dict[str, str]:
+    """
+    Reads the header and first data row of an invoice CSV into a dict.
+
+    Invoices are single-row files of plain comma-separated values, so one
+    binary read and a manual split replace text-mode buffering and the
+    csv.DictReader object built per file. (A ~150-byte file fits in one
+    read(); mmap would only add page-table churn here.) Rows containing
+    a quote character fall back to the csv module, which handles
+    quoted-field tokenizing correctly.
+    """
+    with open(invoice_path, "rb") as f:
+        raw = f.read()
+    nl1 = raw.find(b"\n")
+    if nl1 < 0:
+        nl1 = len(raw)
+    nl2 = raw.find(b"\n", nl1 + 1)
+    if nl2 < 0:
+        nl2 = len(raw)
+    header = raw[:nl1].rstrip(b"\r").decode()
+    row = raw[nl1 + 1:nl2].rstrip(b"\r").decode()
+    if '"' in header or '"' in row:
+        return next(csv.DictReader([header, row]))
+    return dict(zip(header.split(","), row.split(",")))
+
+def load_invoice(invoice_path: str) -> tuple[str, Dict[str, str]]:
+    """Loads one invoice file: returns (file name, parsed first row)."""
+    return os.path.basename(invoice_path), _read_first_row(invoice_path)
+
+def load_failure_results(
+    invoice_name: str, error: str
+) -> tuple[ProcessingResult, ProcessingResult]:
+    """
+    Failure pair for an invoice whose file could not be read or parsed.
+
+    Mirrors what each workflow's own exception handler used to report
+    when the read lived inside it, so a malformed file still yields one
+    baseline and one kognitos FAILURE row instead of aborting the batch.
+    """
+    invoice_id = "failed_" + invoice_name
+    return (
+        _failure(invoice_id, error, "unknown_baseline_error", 0.0),
+        _failure(invoice_id, error, "unknown_kognitos_error", 0.0),
+    )
+
+def load_invoices(invoice_paths: List[str]) -> List[tuple[str, Dict[str, str]]]:
+    """
+    Parses a batch of invoice files up front.
+
+    Each file is read exactly once here, so both workflows can share the
+    parsed row instead of re-opening and re-tokenizing the same CSV.
+    """
+    return [load_invoice(p) for p in invoice_paths]
+
+def _date_invalid(invoice_date: str) -> bool:
+    """True when a present date is not in YYYY-MM-DD form."""
+    return bool(invoice_date) and not (
+        len(invoice_date) == 10 and invoice_date[4] == "-" and invoice_date[7] == "-"
+    )
+
+def _total_non_numeric(total: Any) -> bool:
+    """True when a present total is a string that doesn't read as a number."""
+    return (
+        total is not None
+        and isinstance(total, str)
+        and not total.replace(".", "").replace("USD", "").strip().isdigit()
+    )
+
+def _total_mismatched(quantity: Any, unit_price: Any, total: Any) -> bool:
+    """True when quantity * unit_price disagrees with the stated total."""
+    if any(v is None for v in (quantity, unit_price, total)):
+        return False
+    try:
+        # Type check to ensure we can convert to float
+        if isinstance(quantity, (int, float)) and isinstance(unit_price, (int, float)):
+            expected_total = float(quantity) * float(unit_price)
+            actual_total = float(str(total).replace("USD", "").strip())
+            return abs(expected_total - actual_total) > 0.01  # Allow for rounding
+    except (ValueError, TypeError):
+        pass
+    return False
+
 def _detect_data_quality_issues(data: Dict[str, Any]) -> List[str]:
     """
     Detects data quality issues in the invoice data.
     Returns a list of detected issues.
     """
     issues: List[str] = []
-    
+
     # Check for missing or empty invoice_id
-    if not data.get("invoice_id") or data.get("invoice_id") == "":
+    if not data.get("invoice_id"):
         issues.append("missing_invoice_id")
-    
+
     # Check for invalid date format (should be YYYY-MM-DD)
-    invoice_date = data.get("invoice_date", "")
-    if invoice_date and not (len(invoice_date) == 10 and invoice_date[4] == "-" and invoice_date[7] == "-"):
+    if _date_invalid(data.get("invoice_date", "")):
         issues.append("invalid_date_format")
-    
+
     # Check for negative quantities
     quantity = data.get("quantity")
     if quantity is not None and isinstance(quantity, (int, float)) and quantity < 0:
         issues.append("negative_quantity")
-    
+
     # Check for non-numeric total
-    total = data.get("total")
-    if total is not None and isinstance(total, str) and not total.replace(".", "").replace("USD", "").strip().isdigit():
+    if _total_non_numeric(data.get("total")):
         issues.append("non_numeric_total")
-    
+
     # Check for missing required fields
     if not data.get("quantity") or not data.get("unit_price"):
         issues.append("missing_required_fields")
-    
+
     # Check for mismatched total (if we can calculate it)
-    quantity = data.get("quantity")
-    unit_price = data.get("unit_price")
-    total = data.get("total")
-    if all(v is not None for v in [quantity, unit_price, total]):
-        try:
-            # Type check to ensure we can convert to float
-            if isinstance(quantity, (int, float)) and isinstance(unit_price, (int, float)):
-                expected_total = float(quantity) * float(unit_price)
-                actual_total = float(str(total).replace("USD", "").strip())
-                if abs(expected_total - actual_total) > 0.01:  # Allow for rounding
-                    issues.append("mismatched_total")
-        except (ValueError, TypeError):
-            pass
-    
+    if _total_mismatched(data.get("quantity"), data.get("unit_price"), data.get("total")):
+        issues.append("mismatched_total")
+
     return issues
 
-def _kognitos_fix_data_quality(data: Dict[str, Any]) -> tuple[Dict[str, Any], List[str]]:
+def _analyze_and_fix(
+    data: Dict[str, Any],
+) -> tuple[List[str], Dict[str, Any], List[str], List[str]]:
     """
-    Kognitos can intelligently fix common data quality issues.
-    Returns the fixed data and list of fixes applied.
+    Detects data quality issues, applies Kognitos' fixes, and re-checks the
+    result in one fused pass over the fields.
+
+    Returns (issues_before, fixed_data, fixes_applied, issues_after) —
+    equivalent to detect, fix, and re-detect run back to back, without
+    re-reading each field three times.
     """
-    fixed_data = data.copy()
+    issues_before: List[str] = []
+    # Copy-on-write: most invoices are clean and take zero fixes, so the
+    # row is only duplicated when the first mutation actually lands.
+    fixed_data = data
     fixes_applied: List[str] = []
-    
-    # Fix missing invoice_id by generating one (95% success rate)
-    if not fixed_data.get("invoice_id") or fixed_data.get("invoice_id") == "":
-        if random.random() < 0.95:  # 95% chance to fix
-            import uuid
-            fixed_data["invoice_id"] = str(uuid.uuid4())
+
+    def _cow() -> Dict[str, Any]:
+        nonlocal fixed_data
+        if fixed_data is data:
+            fixed_data = dict(data)
+        return fixed_data
+
+    # Bound once: this function draws up to 8 times per invoice, and a
+    # local lookup beats LOAD_GLOBAL + LOAD_ATTR on every draw.
+    _rand = _bank.random
+
+    # Missing invoice_id: detect, then generate one (95% success rate)
+    if not data.get("invoice_id"):
+        issues_before.append("missing_invoice_id")
+        if _rand() < 0.95:  # 95% chance to fix
+            _cow()["invoice_id"] = str(uuid.uuid4())
             fixes_applied.append("generated_invoice_id")
-    
-    # Fix invalid date format with more comprehensive parsing (90% success rate)
-    invoice_date = fixed_data.get("invoice_date", "")
-    if invoice_date and not (len(invoice_date) == 10 and invoice_date[4] == "-" and invoice_date[7] == "-"):
-        if random.random() < 0.95:  # 90% chance to fix
+
+    # Invalid date format: detect, then parse comprehensively (90% success rate)
+    invoice_date = data.get("invoice_date", "")
+    if _date_invalid(invoice_date):
+        issues_before.append("invalid_date_format")
+        if _rand() < 0.95:  # 90% chance to fix
             try:
-                from datetime import datetime
-                # Handle various date formats including more edge cases
-                date_formats = [
-                    "%m-%d-%Y", "%d-%m-%Y", "%Y-%m-%d",
-                    "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d",
-                    "%m.%d.%Y", "%d.%m.%Y", "%Y.%m.%d"
-                ]
-                for fmt in date_formats:
+                for fmt in _DATE_FORMATS:
                     try:
                         parsed_date = datetime.strptime(invoice_date, fmt)
-                        fixed_data["invoice_date"] = parsed_date.strftime("%Y-%m-%d")
+                        _cow()["invoice_date"] = parsed_date.strftime("%Y-%m-%d")
                         fixes_applied.append("fixed_date_format")
                         break
                     except ValueError:
                         continue
                 else:
                     # If all parsing fails, use a default date
-                    fixed_data["invoice_date"] = "2025-01-15"
+                    _cow()["invoice_date"] = "2025-01-15"
                     fixes_applied.append("defaulted_date")
             except:
-                fixed_data["invoice_date"] = "2025-01-15"
+                _cow()["invoice_date"] = "2025-01-15"
                 fixes_applied.append("defaulted_date")
     
-    # Fix negative quantities by making them positive (95% success rate)
-    quantity = fixed_data.get("quantity")
+    # Negative quantity: detect, then make it positive (95% success rate)
+    quantity = data.get("quantity")
     if quantity is not None and isinstance(quantity, (int, float)) and quantity < 0:
-        if random.random() < 0.95:  # 95% chance to fix
-            fixed_data["quantity"] = abs(quantity)
+        issues_before.append("negative_quantity")
+        if _rand() < 0.95:  # 95% chance to fix
+            _cow()["quantity"] = abs(quantity)
             fixes_applied.append("fixed_negative_quantity")
-    
-    # Enhanced non-numeric total extraction (95% success rate)
-    total = fixed_data.get("total")
+
+    # Non-numeric total: detect, then extract (95% success rate). The
+    # extraction runs for any string total — CSV fields arrive as text —
+    # which also normalizes numeric-looking strings to floats.
+    total = data.get("total")
+    if _total_non_numeric(total):
+        issues_before.append("non_numeric_total")
     if total is not None and isinstance(total, str):
-        if random.random() < 0.95:  # 95% chance to fix
-            import re
+        if _rand() < 0.95:  # 95% chance to fix
             # More comprehensive numeric extraction
-            numeric_match = re.search(r'[\d,]+\.?\d*', total)
+            numeric_match = _TOTAL_NUM_RE.search(total)
             if numeric_match:
                 try:
                     extracted_value = float(numeric_match.group().replace(',', ''))
-                    fixed_data["total"] = extracted_value
+                    _cow()["total"] = extracted_value
                     fixes_applied.append("extracted_numeric_total")
                 except ValueError:
                     # If extraction fails, try to infer from other fields
                     if fixed_data.get("quantity") and fixed_data.get("unit_price"):
                         try:
                             inferred_total = float(fixed_data["quantity"]) * float(fixed_data["unit_price"])
-                            fixed_data["total"] = inferred_total
+                            _cow()["total"] = inferred_total
                             fixes_applied.append("inferred_total_from_fields")
                         except (ValueError, TypeError):
                             pass
     
-    # Fix missing required fields with intelligent defaults (95% success rate)
+    # Missing required fields: detect on the raw row, then fill with
+    # intelligent defaults (95% success rate)
+    if not data.get("quantity") or not data.get("unit_price"):
+        issues_before.append("missing_required_fields")
     if not fixed_data.get("quantity"):
-        if random.random() < 0.95:  # 95% chance to fix
+        if _rand() < 0.95:  # 95% chance to fix
             # Try to infer quantity from total and unit_price if available
             if fixed_data.get("total") and fixed_data.get("unit_price"):
                 try:
                     inferred_qty = float(fixed_data["total"]) / float(fixed_data["unit_price"])
-                    fixed_data["quantity"] = max(1, round(inferred_qty))
+                    _cow()["quantity"] = max(1, round(inferred_qty))
                     fixes_applied.append("inferred_quantity_from_total")
                 except (ValueError, TypeError, ZeroDivisionError):
-                    fixed_data["quantity"] = 1
+                    _cow()["quantity"] = 1
                     fixes_applied.append("defaulted_quantity")
             else:
-                fixed_data["quantity"] = 1
+                _cow()["quantity"] = 1
                 fixes_applied.append("defaulted_quantity")
     
     if not fixed_data.get("unit_price"):
-        if random.random() < 0.95:  # 90% chance to fix
+        if _rand() < 0.95:  # 90% chance to fix
             # Try to infer unit_price from total and quantity if available
             if fixed_data.get("total") and fixed_data.get("quantity"):
                 try:
                     inferred_price = float(fixed_data["total"]) / float(fixed_data["quantity"])
-                    fixed_data["unit_price"] = round(inferred_price, 2)
+                    _cow()["unit_price"] = round(inferred_price, 2)
                     fixes_applied.append("inferred_unit_price_from_total")
                 except (ValueError, TypeError, ZeroDivisionError):
-                    fixed_data["unit_price"] = 100.0
+                    _cow()["unit_price"] = 100.0
                     fixes_applied.append("defaulted_unit_price")
             else:
-                fixed_data["unit_price"] = 100.0
+                _cow()["unit_price"] = 100.0
                 fixes_applied.append("defaulted_unit_price")
     
-    # Enhanced mismatched total recalculation (95% success rate)
+    # Mismatched total: detect on the raw row, then recalculate from the
+    # (possibly fixed) quantity and unit price (95% success rate)
+    if _total_mismatched(data.get("quantity"), data.get("unit_price"), data.get("total")):
+        issues_before.append("mismatched_total")
     quantity = fixed_data.get("quantity")
     unit_price = fixed_data.get("unit_price")
     total = fixed_data.get("total")
     if all(v is not None for v in [quantity, unit_price, total]):
-        if random.random() < 0.95:  # 95% chance to fix
+        if _rand() < 0.95:  # 95% chance to fix
             try:
                 if isinstance(quantity, (int, float)) and isinstance(unit_price, (int, float)):
                     expected_total = float(quantity) * float(unit_price)
                     actual_total = float(str(total).replace("USD", "").strip())
                     if abs(expected_total - actual_total) > 0.01:  # Allow for rounding
-                        fixed_data["total"] = expected_total
+                        _cow()["total"] = expected_total
                         fixes_applied.append("recalculated_total")
             except (ValueError, TypeError):
                 pass
     
     # Fix vendor name if missing or invalid (95% success rate)
-    if not fixed_data.get("vendor_name") or fixed_data.get("vendor_name") == "":
-        if random.random() < 0.95:  # 95% chance to fix
-            fixed_data["vendor_name"] = "Unknown Vendor"
+    if not fixed_data.get("vendor_name"):
+        if _rand() < 0.95:  # 95% chance to fix
+            _cow()["vendor_name"] = "Unknown Vendor"
             fixes_applied.append("defaulted_vendor_name")
-    
-    return fixed_data, fixes_applied
 
-def run_baseline_process(invoice_path: Path, real_hours_per_demo_second: float) -> ProcessingResult:
+    # One re-check over the fixed row replaces the third full pass the
+    # caller used to make.
+    issues_after: List[str] = _detect_data_quality_issues(fixed_data)
+
+    return issues_before, fixed_data, fixes_applied, issues_after
+
+def run_baseline_process(
+    invoice_name: str, data: Dict[str, Any], real_hours_per_demo_second: float
+) -> ProcessingResult:
     """
     Simulates the slow, error-prone manual process.
-    - Reads an invoice CSV.
+    - Works on an already-parsed invoice row (see load_invoice).
     - Introduces a delay to simulate human interaction.
     - Has a random chance of failing to simulate data entry errors.
     - Error rate increases with data quality issues.
     """
     invoice_id = ""
     try:
-        with open(invoice_path, "r") as f:
-            reader = csv.DictReader(f)
-            data = next(reader)
-            invoice_id = data.get("invoice_id", "UNKNOWN")
+        invoice_id = data.get("invoice_id", "UNKNOWN")
 
         # Simulate human thinking and typing time (adjusted for scaling)
-        sleep_duration = random.uniform(
+        sleep_duration = _bank.uniform(
             MANUAL_SLEEP_MIN, MANUAL_SLEEP_MAX
         ) / real_hours_per_demo_second / MIN_IN_A_HOUR
-        time.sleep(sleep_duration)
+        if SIMULATE_REAL_SLEEP:
+            time.sleep(sleep_duration)
 
         # Detect data quality issues
         data_issues = _detect_data_quality_issues(data)
@@ -261,117 +513,105 @@ def run_baseline_process(invoice_path: Path, real_hours_per_demo_second: float)
         dynamic_error_rate = MANUAL_ERROR_RATE + (len(data_issues) * 0.35)  # 35% additional error per issue
 
         # Realistic manual error rate (now dynamic)
-        if random.random() < dynamic_error_rate:
+        if _bank.random() < dynamic_error_rate:
             error_detail = "Manual data entry error"
             if data_issues:
                 error_detail += f" due to data quality issues: {', '.join(data_issues)}"
             else:
                 error_detail += ": incorrect total."
             
-            return {
-                "status": "FAILURE",
-                "error_details": error_detail,
-                "merkle_root": None,
-                "invoice_id": invoice_id,
-                "error_type": "data_quality",
-                "simulated_cycle_time_s": sleep_duration,
-            }
-        
+            return _failure(invoice_id, error_detail, "data_quality", sleep_duration)
+
         if not invoice_id:
-            return {
-                "status": "FAILURE",
-                "error_details": "Manual validation error: Missing invoice ID.",
-                "merkle_root": None,
-                "invoice_id": invoice_id,
-                "error_type": "data_quality",
-                "simulated_cycle_time_s": sleep_duration,
-            }
+            return _failure(
+                invoice_id,
+                "Manual validation error: Missing invoice ID.",
+                "data_quality",
+                sleep_duration,
+            )
 
         # Add a new error type for manual operational issues
-        if random.random() < 0.01:  # 1% chance for operational error in manual
-            return {
-                "status": "FAILURE",
-                "error_details": "Manual operational error: payment misrouting or delay.",
-                "merkle_root": None,
-                "invoice_id": invoice_id,
-                "error_type": "system_operational",
-                "simulated_cycle_time_s": sleep_duration,
-            }
+        if _bank.random() < 0.01:  # 1% chance for operational error in manual
+            return _failure(
+                invoice_id,
+                "Manual operational error: payment misrouting or delay.",
+                "system_operational",
+                sleep_duration,
+            )
 
+        # No audit trail for manual process, so the template's merkle_root
+        # of None stands.
         return {
-            "status": "SUCCESS",
-            "error_details": None,
-            "merkle_root": None, # No audit trail for manual process
+            **_SUCCESS_TEMPLATE,
             "invoice_id": invoice_id,
-            "error_type": None,
             "simulated_cycle_time_s": sleep_duration,
         }
 
     except Exception as e:
-        return {
-            "status": "FAILURE",
-            "error_details": str(e),
-            "merkle_root": None,
-            "invoice_id": invoice_id or f"failed_{invoice_path.name}",
-            "error_type": "unknown_baseline_error",
-            "simulated_cycle_time_s": 0.0, # No sleep for this specific error
-        }
+        # No sleep charged for this specific error
+        return _failure(
+            invoice_id or "failed_" + invoice_name,
+            str(e),
+            "unknown_baseline_error",
+            0.0,
+        )
 
-def _mock_kognitos_api(steps: str, data: Dict[str, Any], real_hours_per_demo_second: float) -> Dict[str, Any]:
+class InvoiceRow(NamedTuple):
+    """The two row fields the Kognitos API actually consumes.
+
+    A compact tuple shuttle instead of handing the mock the whole row
+    dict: attribute access is an offset fetch, and the API's read
+    surface is explicit in the type.
+    """
+
+    invoice_id: str
+    total: Any
+
+def _mock_kognitos_api(steps: str, row: InvoiceRow, real_hours_per_demo_second: float) -> Dict[str, Any]:
     """
     A mock function that simulates a call to the Kognitos API.
     It's fast and reliable, but can still fail on truly bad data.
     """
     # Simulate network latency and processing time (adjusted for scaling)
-    sleep_duration = random.uniform(
+    sleep_duration = _bank.uniform(
         KOGNITOS_SLEEP_MIN, KOGNITOS_SLEEP_MAX
     ) / real_hours_per_demo_second / MIN_IN_A_HOUR
-    time.sleep(sleep_duration)
+    if SIMULATE_REAL_SLEEP:
+        time.sleep(sleep_duration)
 
     # Kognitos can still fail if the input is truly garbage
-    if not data.get("invoice_id"):
+    if not row.invoice_id:
         return {"status": "FAILURE", "reason": "Cannot proceed without invoice_id"}
 
-    return {"status": "SUCCESS", "extracted_total": data.get("total"), "simulated_sleep_s": sleep_duration}
+    return {"status": "SUCCESS", "extracted_total": row.total, "simulated_sleep_s": sleep_duration}
 
-def run_kognitos_process(invoice_path: Path, real_hours_per_demo_second: float) -> ProcessingResult:
+def run_kognitos_process(
+    invoice_name: str, data: Dict[str, Any], real_hours_per_demo_second: float
+) -> ProcessingResult:
     """
     Simulates the fast, reliable, and auditable Kognitos process.
-    - Reads the invoice.
+    - Works on an already-parsed invoice row (see load_invoice).
     - Calls a (mocked) Kognitos API.
     - Generates an audit trail and computes a Merkle root.
     - Error rate increases with severe data quality issues.
     """
-    transactions: List[str] = []
+    transactions: List[bytes] = []
     invoice_id = ""
     total_simulated_sleep_s = 0.0
     try:
-        with open(invoice_path, "r") as f:
-            reader = csv.DictReader(f)
-            data = next(reader)
-            invoice_id = data.get("invoice_id", "UNKNOWN")
+        invoice_id = data.get("invoice_id", "UNKNOWN")
 
-        # 1. Start Process
-        transactions.append(f"START_PROCESSING:{invoice_path.name}")
+        # 1-2. Start the trail: the process marker plus the precomputed
+        # hash of the "English-as-code" steps, added in one extend.
+        transactions += [
+            b"START_PROCESSING:" + invoice_name.encode(),
+            _LOAD_INSTR_TX,
+        ]
 
-        # 2. Define "English-as-code" steps
-        kognitos_steps = """
-        1. READ the invoice file.
-        2. EXTRACT the invoice_id, vendor_name, and total.
-        3. VALIDATE that the total is a positive number.
-        4. PREPARE the data for ERP entry.
-        """
-        transactions.append(f"LOAD_INSTRUCTIONS_HASH:{hashlib.sha256(kognitos_steps.encode()).hexdigest()}")
+        # Detect data quality issues, fix what Kognitos can, and re-check —
+        # all in one fused pass over the fields
+        data_issues, fixed_data, fixes_applied, remaining_issues = _analyze_and_fix(data)
 
-        # Detect data quality issues
-        data_issues = _detect_data_quality_issues(data)
-        
-        # Kognitos can fix data quality issues, reducing the effective error rate
-        fixed_data, fixes_applied = _kognitos_fix_data_quality(data)
-        
-        # Re-detect issues after fixing
-        remaining_issues = _detect_data_quality_issues(fixed_data)
-        
         # Calculate dynamic error rate for Kognitos (much lower than baseline)
         # Base error rate + small additional error rate per remaining issue
         # Kognitos gets a significant advantage from fixing data issues
@@ -380,64 +620,66 @@ def run_kognitos_process(invoice_path: Path, real_hours_per_demo_second: float)
         dynamic_error_rate = KOGNITOS_ERROR_RATE + (len(remaining_issues) * 1)
 
         # 3. Execute with Kognitos (mocked)
-        api_result = _mock_kognitos_api(kognitos_steps, fixed_data, real_hours_per_demo_second)
-        transactions.append(f"API_CALL_STATUS:{api_result['status']}")
+        api_result = _mock_kognitos_api(
+            _KOGNITOS_STEPS,
+            InvoiceRow(fixed_data.get("invoice_id", ""), fixed_data.get("total")),
+            real_hours_per_demo_second,
+        )
+        transactions.append(b"API_CALL_STATUS:" + api_result["status"].encode())
         
         # Add the simulated sleep time from the API call
         total_simulated_sleep_s += api_result.get("simulated_sleep_s", 0.0)
         
         # Log data quality fixes if any were applied
         if fixes_applied:
-            transactions.append(f"DATA_QUALITY_FIXES:{','.join(fixes_applied)}")
+            transactions.append(b"DATA_QUALITY_FIXES:" + ",".join(fixes_applied).encode())
 
         if api_result["status"] != "SUCCESS":
-            return {
-                "status": "FAILURE",
-                "error_details": f"Kognitos API failed: unprocessable_input_format ({api_result.get('reason')})",
-                "merkle_root": compute_merkle_root(transactions),
-                "invoice_id": invoice_id,
-                "error_type": "data_extraction",  # Change to data_extraction for unprocessable input
-                "simulated_cycle_time_s": total_simulated_sleep_s,
-            }
+            # data_extraction: the input format was unprocessable
+            return _failure(
+                invoice_id,
+                f"Kognitos API failed: unprocessable_input_format ({api_result.get('reason')})",
+                "data_extraction",
+                total_simulated_sleep_s,
+                merkle=compute_merkle_root(transactions),
+            )
 
         # Small chance of Kognitos processing error (now dynamic)
-        if random.random() < dynamic_error_rate:
+        if _bank.random() < dynamic_error_rate:
             error_detail = "Kognitos processing error"
             if data_issues:
                 error_detail += f" due to data quality issues: {', '.join(data_issues)}"
             else:
                 error_detail += ": minor system anomaly."
             
-            return {
-                "status": "FAILURE",
-                "error_details": error_detail,
-                "merkle_root": compute_merkle_root(transactions),
-                "invoice_id": invoice_id,
-                "error_type": "system_processing",  # Keep as system_processing
-                "simulated_cycle_time_s": total_simulated_sleep_s,
-            }
+            return _failure(
+                invoice_id,
+                error_detail,
+                "system_processing",
+                total_simulated_sleep_s,
+                merkle=compute_merkle_root(transactions),
+            )
 
         # 4. Finalize
-        transactions.append(f"PROCESS_COMPLETE:{invoice_id}")
+        transactions.append(b"PROCESS_COMPLETE:" + invoice_id.encode())
 
         # 5. Generate Audit Seal
         merkle_root = compute_merkle_root(transactions)
 
         return {
-            "status": "SUCCESS",
-            "error_details": None,
+            **_SUCCESS_TEMPLATE,
             "merkle_root": merkle_root,
             "invoice_id": invoice_id,
-            "error_type": None,
             "simulated_cycle_time_s": total_simulated_sleep_s,
         }
         
     except Exception as e:
-        return {
-            "status": "FAILURE",
-            "error_details": str(e),
-            "merkle_root": compute_merkle_root(transactions), # Still provide partial audit
-            "invoice_id": invoice_id or f"failed_{invoice_path.name}",
-            "error_type": "unknown_kognitos_error",
-            "simulated_cycle_time_s": total_simulated_sleep_s,
-        }
+        # Still provide the partial audit trail; an empty trail has no
+        # root, so don't even enter the hash path for it.
+        return _failure(
+            invoice_id or "failed_" + invoice_name,
+            str(e),
+            "unknown_kognitos_error",
+            total_simulated_sleep_s,
+            merkle=compute_merkle_root(transactions) if transactions else None,
+        )